@@ -289,8 +289,13 @@ class APIDocsHandler(Generic[OpenAPIRootType], ABC):
         return docs.deprecated if docs else None
 
     def router_to_paths_dict(
-        self, router: Router, mapper: Callable[[Route], T]
+        self, router: Router, mapper: Optional[Callable[[Route], T]] = None
     ) -> Dict[str, Dict[str, T]]:
+        """
+        Returns a dictionary of the routes of the given router, by path and by
+        lowercase HTTP method. Routes are mapped using the given callable, or
+        kept as they are if no mapper is given.
+        """
         routes_dictionary: Dict[str, Dict[str, T]] = {}
 
         for method, routes in router.routes.items():
@@ -311,7 +316,9 @@ class APIDocsHandler(Generic[OpenAPIRootType], ABC):
                         # ignore catch-all routes from api docs
                         continue
                     routes_dictionary[key] = {}
-                routes_dictionary[key][method.decode("utf8").lower()] = mapper(route)
+                routes_dictionary[key][method.decode("utf8").lower()] = (
+                    route if mapper is None else mapper(route)
+                )
 
         return routes_dictionary
 
@@ -513,16 +513,29 @@ def parse_docstring(
     return dialects[0].parse_docstring(docstring)
 
 
-_handlers_docstring_info = WeakKeyDictionary()
+_handlers_docstring_info: "WeakKeyDictionary[Any, Optional[DocstringInfo]]" = (
+    WeakKeyDictionary()
+)
 
 
-def get_handler_docstring_info(handler) -> DocstringInfo:
-    if handler not in _handlers_docstring_info:
-        docs = handler.__doc__
+def _get_docstring_info(handler) -> Optional[DocstringInfo]:
+    docs = handler.__doc__
 
-        if docs:
-            docstring_info = parse_docstring(docs)
-        else:
-            docstring_info = None
-        _handlers_docstring_info[handler] = docstring_info
-    return _handlers_docstring_info[handler]
+    if docs:
+        return parse_docstring(docs)
+    return None
+
+
+def get_handler_docstring_info(handler) -> Optional[DocstringInfo]:
+    # docstrings don't change at runtime, so they are parsed only once per handler
+    try:
+        return _handlers_docstring_info[handler]
+    except KeyError:
+        pass
+    except TypeError:
+        # the handler cannot be weakly referenced
+        return _get_docstring_info(handler)
+
+    docstring_info = _get_docstring_info(handler)
+    _handlers_docstring_info[handler] = docstring_info
+    return docstring_info
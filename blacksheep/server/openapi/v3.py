@@ -1,14 +1,16 @@
 import collections.abc as collections_abc
-import inspect
 import warnings
 from abc import ABC, abstractmethod
+from copy import copy
 from dataclasses import dataclass, fields, is_dataclass
 from datetime import date, datetime
 from enum import Enum, IntEnum
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 from typing import _GenericAlias as GenericAlias
 from typing import get_type_hints
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
 from openapidocs.common import Format
 from openapidocs.v3 import (
@@ -69,42 +71,91 @@ except ImportError:  # pragma: no cover
     BaseModel = ...  # type: ignore
 
 
+_SIMPLE_TYPES_SCHEMAS: Dict[Any, Schema] = {
+    str: Schema(type=ValueType.STRING),
+    int: Schema(type=ValueType.INTEGER, format=ValueFormat.INT64),
+    float: Schema(type=ValueType.NUMBER, format=ValueFormat.FLOAT),
+    bool: Schema(type=ValueType.BOOLEAN),
+    UUID: Schema(type=ValueType.STRING, format=ValueFormat.UUID),
+    date: Schema(type=ValueType.STRING, format=ValueFormat.DATE),
+    datetime: Schema(type=ValueType.STRING, format=ValueFormat.DATETIME),
+}
+
+
+_BINDERS_LOCATIONS: Dict[Type[Binder], ParameterLocation] = {
+    RouteBinder: ParameterLocation.PATH,
+    QueryBinder: ParameterLocation.QUERY,
+    CookieBinder: ParameterLocation.COOKIE,
+    HeaderBinder: ParameterLocation.HEADER,
+}
+
+
+_SOURCES_LOCATIONS: Dict[ParameterSource, ParameterLocation] = {
+    source: ParameterLocation[source.value.upper()] for source in ParameterSource
+}
+
+
+# HTTP methods that can be documented as operations of a PathItem
+_PATH_ITEM_OPERATIONS = frozenset(
+    {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+)
+
+
 def get_origin(object_type):
     return getattr(object_type, "__origin__", None)
 
 
+@lru_cache(maxsize=4096)
+def _get_union_child_type(object_type: Any) -> Tuple[bool, Any]:
+    # support only Union[None, Type] - that is equivalent of Optional[Type]
+    if type(None) not in object_type.__args__ or len(object_type.__args__) > 2:
+        raise UnsupportedUnionTypeException(object_type)
+
+    for possible_type in object_type.__args__:
+        if type(None) is possible_type:
+            continue
+        return True, possible_type
+    return False, object_type  # pragma: no cover
+
+
 def check_union(object_type: Any) -> Tuple[bool, Any]:
-    if hasattr(object_type, "__origin__") and object_type.__origin__ is Union:
-        # support only Union[None, Type] - that is equivalent of Optional[Type]
-        if type(None) not in object_type.__args__ or len(object_type.__args__) > 2:
-            raise UnsupportedUnionTypeException(object_type)
+    if getattr(object_type, "__origin__", None) is not Union:
+        return False, object_type
 
-        for possible_type in object_type.__args__:
-            if type(None) is possible_type:
-                continue
-            return True, possible_type
-    return False, object_type
+    try:
+        return _get_union_child_type(object_type)
+    except TypeError:
+        # unhashable type annotation
+        return _get_union_child_type.__wrapped__(object_type)
+
+
+_IGNORED_PARAMETERS_NAMES = frozenset({"request", "services"})
+
+_DOCUMENTED_BINDERS = tuple(_BINDERS_LOCATIONS)
 
 
 def is_ignored_parameter(param_name: str, matching_binder: Optional[Binder]) -> bool:
+    if param_name in _IGNORED_PARAMETERS_NAMES:
+        return True
+
+    if matching_binder is None or type(matching_binder) in _BINDERS_LOCATIONS:
+        return False
+
     # if a binder is used, handle only those that can be mapped to a type of
     # OpenAPI Documentation parameter's location
-    if matching_binder and not isinstance(
-        matching_binder,
-        (
-            QueryBinder,
-            RouteBinder,
-            HeaderBinder,
-            CookieBinder,
-        ),
-    ):
-        return True
+    return not isinstance(matching_binder, _DOCUMENTED_BINDERS)
 
-    return param_name == "request" or param_name == "services"
+
+FieldsPlan = Tuple[Tuple[Tuple[str, Any], ...], Tuple[str, ...]]
+
+
+BindersIndex = Tuple[Optional[BodyBinder], Dict[str, Binder]]
 
 
 @dataclass
 class FieldInfo:
+    __slots__ = ("name", "type")
+
     name: str
     type: Union[Type, Schema]
 
@@ -122,21 +173,36 @@ class ObjectTypeHandler(ABC):
         object type handler.
         """
 
-    def get_type_fields(self, object_type) -> List[FieldInfo]:
+    def get_type_fields(self, object_type) -> Sequence[FieldInfo]:
         """
         Returns a set of fields to be used for the handled type.
         """
 
 
 class DataClassTypeHandler(ObjectTypeHandler):
+    def __init__(self) -> None:
+        self._fields_cache: Dict[Type, Sequence[FieldInfo]] = {}
+
     def handles_type(self, object_type) -> bool:
         return is_dataclass(object_type)
 
-    def get_type_fields(self, object_type) -> List[FieldInfo]:
-        return [FieldInfo(field.name, field.type) for field in fields(object_type)]
+    def get_type_fields(self, object_type) -> Sequence[FieldInfo]:
+        try:
+            return self._fields_cache[object_type]
+        except KeyError:
+            pass
+
+        type_fields = tuple(
+            FieldInfo(field.name, field.type) for field in fields(object_type)
+        )
+        self._fields_cache[object_type] = type_fields
+        return type_fields
 
 
 class PydanticModelTypeHandler(ObjectTypeHandler):
+    def __init__(self) -> None:
+        self._fields_cache: Dict[Type, Sequence[FieldInfo]] = {}
+
     def handles_type(self, object_type) -> bool:
         if isinstance(object_type, GenericAlias):
             # support for Generic BaseModel here is better since it can extract items
@@ -147,7 +213,7 @@ class PydanticModelTypeHandler(ObjectTypeHandler):
             return False
         if (
             BaseModel is not ...
-            and inspect.isclass(object_type)
+            and isinstance(object_type, type)
             and issubclass(object_type, BaseModel)  # type: ignore
         ):
             return True
@@ -206,11 +272,17 @@ class PydanticModelTypeHandler(ObjectTypeHandler):
 
         return Schema()
 
-    def get_type_fields(self, object_type) -> List[FieldInfo]:
+    def get_type_fields(self, object_type) -> Sequence[FieldInfo]:
         # to support all pydantic special types, here we rely on its schema,
         # but since we want to be able to generate OpenAPI Documentation V3 (or V2 for
         # that matter), we extract basic information we need; also using the type's
-        # __fields__ when available
+        # __fields__ when available;
+        # since obtaining the schema of a model is expensive, fields are cached
+        try:
+            return self._fields_cache[object_type]
+        except KeyError:
+            pass
+
         schema = object_type.schema()
         properties = schema["properties"]
 
@@ -219,7 +291,7 @@ class PydanticModelTypeHandler(ObjectTypeHandler):
         except AttributeError:
             fields_info = dict()
 
-        return [
+        type_fields = tuple(
             FieldInfo(
                 name,
                 self._open_api_v2_field_schema_to_type(
@@ -227,7 +299,9 @@ class PydanticModelTypeHandler(ObjectTypeHandler):
                 ),
             )
             for name, value in properties.items()
-        ]
+        )
+        self._fields_cache[object_type] = type_fields
+        return type_fields
 
 
 class OpenAPIHandler(APIDocsHandler[OpenAPI]):
@@ -257,17 +331,40 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
         self.info = info
         self.components = Components()
         self._objects_references: Dict[Any, Reference] = {}
+        self._objects_references_by_id: Dict[int, Tuple[Any, Reference]] = {}
+        self._schema_cache: Dict[Tuple[Any, Optional[frozenset]], Reference] = {}
+        self._type_hints_cache: Dict[Type, Dict[str, Any]] = {}
+        self._handler_for_type: Dict[Any, Optional[ObjectTypeHandler]] = {}
+        self._fields_plans: Dict[Any, FieldsPlan] = {}
+        self._names_counters: Dict[str, int] = {}
+        self._binders_index: "WeakKeyDictionary[Any, Tuple[Any, BindersIndex]]" = (
+            WeakKeyDictionary()
+        )
         self.servers: List[Server] = []
         self.common_responses: Dict[ResponseStatusType, ResponseDoc] = {}
         self._object_types_handlers: List[ObjectTypeHandler] = [
             DataClassTypeHandler(),
             PydanticModelTypeHandler(),
         ]
+        self._known_object_types_handlers = list(self._object_types_handlers)
 
     @property
     def object_types_handlers(self) -> List[ObjectTypeHandler]:
         return self._object_types_handlers
 
+    def _check_object_types_handlers(self) -> None:
+        """
+        Clears the information obtained from object types handlers, if handlers
+        were added or removed since it was obtained.
+        """
+        if self._object_types_handlers == self._known_object_types_handlers:
+            return
+
+        self._known_object_types_handlers = list(self._object_types_handlers)
+        self._handler_for_type.clear()
+        self._fields_plans.clear()
+        self._schema_cache.clear()
+
     def get_ui_page_title(self) -> str:
         return self.info.title
 
@@ -293,10 +390,10 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
         # Therefore, a generic that would be expressed in Python: Example[Foo, Bar]
         # and C# or TypeScript Example<Foo, Bar>
         # Becomes here represented as: ExampleOfFooAndBar
-        origin = get_origin(object_type)
+        origin = getattr(object_type, "__origin__", None)
         args = object_type.__args__
         args_repr = "And".join(
-            self.get_type_name(arg, context_type_args) for arg in args
+            [self.get_type_name(arg, context_type_args) for arg in args]
         )
         return f"{self.get_type_name(origin)}Of{args_repr}"
 
@@ -305,8 +402,10 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
     ) -> str:
         if context_type_args and object_type in context_type_args:
             object_type = context_type_args.get(object_type)
-        if hasattr(object_type, "__name__"):
-            return object_type.__name__
+
+        name = getattr(object_type, "__name__", None)
+        if name is not None:
+            return name
         if isinstance(object_type, GenericAlias):
             return self.get_type_name_for_generic(object_type, context_type_args)
         raise ValueError(
@@ -324,25 +423,48 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
         return schema
 
     def _register_schema(self, schema: Schema, name: str) -> Reference:
-        if self.components.schemas is None:
-            self.components.schemas = {}
-
-        if name in self.components.schemas:
-            counter = 0
-            base_name = name
-            while name in self.components.schemas:
+        schemas = self.components.schemas
+        if schemas is None:
+            schemas = self.components.schemas = {}
+
+        if name in schemas:
+            # start from the last suffix used for the same name, to not probe
+            # again names that are known to be taken
+            counter = self._names_counters.get(name, 0) + 1
+            while f"{name}{counter}" in schemas:
                 counter += 1
-                name = f"{base_name}{counter}"
+            self._names_counters[name] = counter
+            name = f"{name}{counter}"
 
-        self.components.schemas[name] = schema
+        schemas[name] = schema
         return Reference(f"#/components/schemas/{name}")
 
+    def _resolve_handler(self, object_type: Any) -> Optional[ObjectTypeHandler]:
+        """
+        Returns the object type handler for the given type, if any, probing the
+        configured handlers only the first time a type is seen.
+        """
+        try:
+            return self._handler_for_type[object_type]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable type annotation
+            return self._find_handler(object_type)
+
+        handler = self._find_handler(object_type)
+        self._handler_for_type[object_type] = handler
+        return handler
+
+    def _find_handler(self, object_type: Any) -> Optional[ObjectTypeHandler]:
+        for handler in self._object_types_handlers:
+            if handler.handles_type(object_type):
+                return handler
+        return None
+
     def _can_handle_class_type(self, object_type: Type) -> bool:
         return (
-            any(
-                handler.handles_type(object_type)
-                for handler in self._object_types_handlers
-            )
+            self._resolve_handler(object_type) is not None
             or object_type in self._types_schemas
         )
 
@@ -353,8 +475,7 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
             schema,
             type_name,
         )
-        self._objects_references[object_type] = reference
-        self._objects_references[type_name] = reference
+        self._store_reference(object_type, type_name, reference)
         return reference
 
     def _get_schema_for_class(self, object_type: Type) -> Reference:
@@ -363,24 +484,55 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
         if object_type in self._types_schemas:
             return self._handle_type_having_explicit_schema(object_type)
 
-        required: List[str] = []
+        children, required = self._get_fields_plan(object_type)
         properties: Dict[str, Union[Schema, Reference]] = {}
+        annotations: Optional[Dict[str, Any]] = None
+
+        for name, child_type in children:
+            if isinstance(child_type, str):
+                # this is a forward reference, we need to obtain a full type here;
+                # type hints are obtained only once, and only if needed
+                if annotations is None:
+                    annotations = self._get_type_hints(object_type)
+
+                child_type = annotations.get(name, child_type)
+
+            properties[name] = self.get_schema_by_type(child_type)
+
+        return self._handle_object_type(object_type, properties, list(required))
+
+    def _get_fields_plan(self, object_type: Type) -> FieldsPlan:
+        """
+        Returns the names and types of the fields of a class, with optional types
+        unwrapped, and the names of its required fields. These are obtained once
+        per class, since generic classes are walked once for each of their
+        concrete types (e.g. PaginatedSet[Cat], PaginatedSet[Foo]).
+        """
+        try:
+            return self._fields_plans[object_type]
+        except KeyError:
+            pass
+
+        children: List[Tuple[str, Any]] = []
+        required: List[str] = []
 
         for field in self.get_fields(object_type):
             is_optional, child_type = check_union(field.type)
             if not is_optional:
                 required.append(field.name)
+            children.append((field.name, child_type))
 
-            if isinstance(child_type, str):
-                # this is a forward reference, we need to obtain a full type here
-                annotations = get_type_hints(object_type)
+        fields_plan = tuple(children), tuple(required)
+        self._fields_plans[object_type] = fields_plan
+        return fields_plan
 
-                if field.name in annotations:
-                    child_type = annotations[field.name]
-
-            properties[field.name] = self.get_schema_by_type(child_type)
-
-        return self._handle_object_type(object_type, properties, required)
+    def _get_type_hints(self, object_type: Type) -> Dict[str, Any]:
+        try:
+            return self._type_hints_cache[object_type]
+        except KeyError:
+            type_hints = get_type_hints(object_type)
+            self._type_hints_cache[object_type] = type_hints
+            return type_hints
 
     def _handle_object_type(
         self,
@@ -398,23 +550,38 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
             ),
             type_name,
         )
+        self._store_reference(object_type, type_name, reference)
+        return reference
+
+    def _store_reference(
+        self, object_type: Type[Any], type_name: str, reference: Reference
+    ) -> None:
         self._objects_references[object_type] = reference
         self._objects_references[type_name] = reference
-        return reference
+        # the type is stored together with its reference, to keep it alive and
+        # its id therefore stable
+        self._objects_references_by_id[id(object_type)] = (object_type, reference)
 
     def _get_stored_reference(
         self, object_type: Type[Any], type_args: Optional[Dict[Any, Type]] = None
     ) -> Optional[Reference]:
-        if object_type in self._objects_references:
+        # fast path, avoiding the computation of the hash of generic types, which
+        # depends on their arguments
+        stored = self._objects_references_by_id.get(id(object_type))
+        if stored is not None:
+            return stored[1]
+
+        objects_references = self._objects_references
+        reference = objects_references.get(object_type)
+        if reference is not None:
+            return reference
+
+        if type_args:
             # if object_type is a generic, it can be like
             # Example[~T] while type_args can have the information: {~T: Foo}
             # in such case; check
-            return self._objects_references[object_type]
-
-        if type_args:
             type_name = self.get_type_name(object_type, type_args)
-            if type_name in self._objects_references:
-                return self._objects_references[type_name]
+            return objects_references.get(type_name)
 
         return None
 
@@ -426,23 +593,47 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
         if isinstance(object_type, Schema):
             return object_type
 
+        self._check_object_types_handlers()
+
         stored_ref = self._get_stored_reference(object_type, type_args)
         if stored_ref:
             return stored_ref
 
+        # the same types are visited many times while generating documentation,
+        # (e.g. types shared by several request handlers, list items, generic
+        # arguments): references are therefore memoized by type and type
+        # arguments; schemas are not, since they can be modified by callers
+        schema_cache = self._schema_cache
+        try:
+            key = (object_type, frozenset(type_args.items()) if type_args else None)
+            cached_ref = schema_cache.get(key)
+        except TypeError:
+            # unhashable type annotation, cannot be cached
+            key = None
+            cached_ref = None
+
+        if cached_ref is not None:
+            return cached_ref
+
         is_optional, child_type = check_union(object_type)
-        schema = self._get_schema_by_type(child_type, type_args)
+
+        # references stored for object_type were checked above, for Optional[T]
+        # it's necessary to check references stored for T
+        stored_ref = (
+            self._get_stored_reference(child_type, type_args) if is_optional else None
+        )
+        schema = stored_ref or self._get_schema_by_type(child_type, type_args)
         if isinstance(schema, Schema) and not is_optional:
             schema.nullable = is_optional
+
+        if key is not None and isinstance(schema, Reference):
+            schema_cache[key] = schema
         return schema
 
     def _get_schema_by_type(
         self, object_type: Type[Any], type_args: Optional[Dict[Any, Type]] = None
     ) -> Union[Schema, Reference]:
-        stored_ref = self._get_stored_reference(object_type, type_args)
-        if stored_ref:  # pragma: no cover
-            return stored_ref
-
+        # note: references stored for object_type are checked by the caller
         if self._can_handle_class_type(object_type):
             return self._get_schema_for_class(object_type)
 
@@ -460,33 +651,18 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
             if schema:
                 return schema
 
-        if inspect.isclass(object_type):
+        if isinstance(object_type, type):
             schema = self._try_get_schema_for_enum(object_type)
         return schema or Schema()
 
     def _try_get_schema_for_simple_type(self, object_type: Type) -> Optional[Schema]:
-        if object_type is str:
-            return Schema(type=ValueType.STRING)
-
-        if object_type is int:
-            return Schema(type=ValueType.INTEGER, format=ValueFormat.INT64)
-
-        if object_type is float:
-            return Schema(type=ValueType.NUMBER, format=ValueFormat.FLOAT)
-
-        if object_type is bool:
-            return Schema(type=ValueType.BOOLEAN)
-
-        if object_type is UUID:
-            return Schema(type=ValueType.STRING, format=ValueFormat.UUID)
-
-        if object_type is date:
-            return Schema(type=ValueType.STRING, format=ValueFormat.DATE)
-
-        if object_type is datetime:
-            return Schema(type=ValueType.STRING, format=ValueFormat.DATETIME)
-
-        return None
+        try:
+            schema = _SIMPLE_TYPES_SCHEMAS.get(object_type)
+        except TypeError:
+            # unhashable type annotation
+            return None
+        # schemas are copied because callers can modify them (e.g. nullable)
+        return copy(schema) if schema is not None else None
 
     def _try_get_schema_for_iterable(
         self, object_type: Type, context_type_args: Optional[Dict[Any, Type]] = None
@@ -495,7 +671,7 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
             # the user didn't specify the item type
             return Schema(type=ValueType.ARRAY, items=Schema(type=ValueType.STRING))
 
-        origin = get_origin(object_type)
+        origin = getattr(object_type, "__origin__", None)
 
         if not origin or origin not in {list, set, tuple, collections_abc.Sequence}:
             return None
@@ -507,7 +683,7 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
         except AttributeError:  # pragma: no cover
             item_type = str
         else:
-            item_type = next(iter(type_args), str)
+            item_type = type_args[0] if type_args else str
 
         if context_type_args and item_type in context_type_args:
             item_type = context_type_args.get(item_type)
@@ -517,34 +693,31 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
             items=self.get_schema_by_type(item_type, context_type_args),
         )
 
-    def get_fields(self, object_type: Any) -> List[FieldInfo]:
-        for handler in self._object_types_handlers:
-            if handler.handles_type(object_type):
-                return handler.get_type_fields(object_type)
+    def get_fields(self, object_type: Any) -> Sequence[FieldInfo]:
+        self._check_object_types_handlers()
+        handler = self._resolve_handler(object_type)
 
-        return []
+        if handler is None:
+            return []
+        return handler.get_type_fields(object_type)
 
     def _try_get_schema_for_generic(
         self, object_type: Type, context_type_args: Optional[Dict[Any, Type]] = None
     ) -> Optional[Reference]:
-        origin = get_origin(object_type)
+        origin = getattr(object_type, "__origin__", None)
 
-        required: List[str] = []
+        children, required = self._get_fields_plan(origin)
         properties: Dict[str, Union[Schema, Reference]] = {}
 
         args = object_type.__args__
         parameters = origin.__parameters__
         type_args = dict(zip(parameters, args))
 
-        for field in self.get_fields(origin):
-            is_optional, child_type = check_union(field.type)
-            if not is_optional:
-                required.append(field.name)
-
+        for name, child_type in children:
             if isinstance(child_type, str):
                 warnings.warn(
                     f"The return type {object_type!r} contains a forward reference "
-                    f"for {field.name}. Forward references in Generic types are not "
+                    f"for {name}. Forward references in Generic types are not "
                     "supported for automatic generation of OpenAPI Documentation. "
                     "For more information see "
                     "https://www.neoteroi.dev/blacksheep/openapi/",
@@ -558,10 +731,10 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
                 #    item: T
                 child_type = type_args.get(child_type)
 
-            properties[field.name] = self.get_schema_by_type(child_type, type_args)
+            properties[name] = self.get_schema_by_type(child_type, type_args)
 
         return self._handle_object_type(
-            object_type, properties, required, context_type_args
+            object_type, properties, list(required), context_type_args
         )
 
     def _try_get_schema_for_enum(self, object_type: Type) -> Optional[Schema]:
@@ -571,22 +744,56 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
             return Schema(type=ValueType.STRING, enum=[v.value for v in object_type])
         return None
 
+    def _get_binders_index(
+        self, handler: Any, binders: Sequence[Binder]
+    ) -> BindersIndex:
+        """
+        Returns the body binder and the binders by parameter name of a request
+        handler, indexing them the first time its binders are seen.
+        """
+        # binders are assigned to request handlers when an application starts,
+        # so a handler shared by several applications can get new binders
+        try:
+            indexed_binders, binders_index = self._binders_index[handler]
+        except KeyError:
+            pass
+        except TypeError:
+            # the handler cannot be weakly referenced
+            return self._index_binders(binders)
+        else:
+            if indexed_binders is binders:
+                return binders_index
+
+        binders_index = self._index_binders(binders)
+        self._binders_index[handler] = (binders, binders_index)
+        return binders_index
+
+    def _index_binders(self, binders: Sequence[Binder]) -> BindersIndex:
+        body_binder: Optional[BodyBinder] = None
+        binders_by_name: Dict[str, Binder] = {}
+
+        for binder in binders:
+            if body_binder is None and isinstance(binder, BodyBinder):
+                body_binder = binder
+            if binder.parameter_name not in binders_by_name:
+                binders_by_name[binder.parameter_name] = binder
+
+        return body_binder, binders_by_name
+
     def _get_body_binder(self, handler: Any) -> Optional[BodyBinder]:
-        return next(
-            (binder for binder in handler.binders if isinstance(binder, BodyBinder)),
-            None,
-        )
+        return self._get_binders_index(handler, handler.binders)[0]
 
     def _get_binder_by_name(self, handler: Any, name: str) -> Optional[Binder]:
-        return next(
-            (binder for binder in handler.binders if binder.parameter_name == name),
-            None,
-        )
+        return self._get_binders_index(handler, handler.binders)[1].get(name)
 
     def get_request_body(self, handler: Any) -> Union[None, RequestBody, Reference]:
-        if not hasattr(handler, "binders"):
+        try:
+            binders: List[Binder] = handler.binders
+        except AttributeError:
+            # the object doesn't have binders
             return None
-        body_binder = self._get_body_binder(handler)
+
+        body_binder = self._get_binders_index(handler, binders)[0]
 
         if body_binder is None:
             return None
@@ -614,28 +821,27 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
     def get_parameter_location_for_binder(
         self, binder: Binder
     ) -> Optional[ParameterLocation]:
-        if isinstance(binder, RouteBinder):
-            return ParameterLocation.PATH
-        if isinstance(binder, QueryBinder):
-            return ParameterLocation.QUERY
-        if isinstance(binder, CookieBinder):
-            return ParameterLocation.COOKIE
-        if isinstance(binder, HeaderBinder):
-            return ParameterLocation.HEADER
+        # the first item in the MRO is the type itself, so it's enough to walk it
+        # to support subclasses of the known binders
+        for binder_type in type(binder).__mro__:
+            location = _BINDERS_LOCATIONS.get(binder_type)
+            if location is not None:
+                return location
         return None
 
     def _parameter_source_to_openapi_obj(
         self, value: ParameterSource
     ) -> ParameterLocation:
-        return ParameterLocation[value.value.upper()]
+        return _SOURCES_LOCATIONS[value]
 
     def get_parameters(
         self, handler: Any
     ) -> Optional[List[Union[Parameter, Reference]]]:
-        if not hasattr(handler, "binders"):
+        try:
+            binders: List[Binder] = handler.binders
+        except AttributeError:
             return None
-        binders: List[Binder] = handler.binders
-        parameters: Mapping[str, Union[Parameter, Reference]] = {}
+        parameters: Dict[str, Union[Parameter, Reference]] = {}
 
         docs = self.get_handler_docs(handler)
         parameters_info = (docs.parameters if docs else None) or dict()
@@ -648,7 +854,7 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
                 # expressed in OpenAPI Docs (e.g. a DI service)
                 continue
 
-            if location == ParameterLocation.PATH:
+            if location is ParameterLocation.PATH:
                 required = True
             else:
                 required = binder.required and binder.default is empty
@@ -786,20 +992,16 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
             else:
                 return responses
 
-        responses.update(
-            {
-                response_status_to_str(key): (
-                    ResponseDoc(
-                        description=value.description,
-                        content=self._get_content_from_response_info(value.content),
-                        headers=self._get_headers_from_response_info(value.headers),
-                    )
-                    if isinstance(value, ResponseInfo)
-                    else ResponseDoc(description=value)
+        for key, value in data.items():
+            responses[response_status_to_str(key)] = (
+                ResponseDoc(
+                    description=value.description,
+                    content=self._get_content_from_response_info(value.content),
+                    headers=self._get_headers_from_response_info(value.headers),
                 )
-                for key, value in data.items()
-            }
-        )
+                if isinstance(value, ResponseInfo)
+                else ResponseDoc(description=value)
+            )
         return responses
 
     def on_docs_generated(self, docs: OpenAPI) -> None:
@@ -817,12 +1019,17 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
         if not endpoint_docs.summary and docstring_info.summary:
             endpoint_docs.summary = docstring_info.summary
 
-        for param_name, param_info in docstring_info.parameters.items():
-            if endpoint_docs.parameters is None:
-                endpoint_docs.parameters = {}
+        if not docstring_info.parameters:
+            return
+
+        if endpoint_docs.parameters is None:
+            endpoint_docs.parameters = {}
 
+        parameters = endpoint_docs.parameters
+
+        for param_name, param_info in docstring_info.parameters.items():
             # did the user specify parameter information explicitly, using @docs?
-            matching_parameter = endpoint_docs.parameters.get(param_name)
+            matching_parameter = parameters.get(param_name)
 
             if matching_parameter is None:
                 matching_binder = self._get_binder_by_name(handler, param_name)
@@ -840,8 +1047,8 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
                     # this must not be documented in OpenAPI Documentation!
                     continue
 
-                assert isinstance(endpoint_docs.parameters, dict)
-                endpoint_docs.parameters[param_name] = ParameterInfo(
+                assert isinstance(parameters, dict)
+                parameters[param_name] = ParameterInfo(
                     value_type=param_info.value_type,
                     required=param_info.required,
                     description=param_info.description,
@@ -872,10 +1079,10 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
     def get_routes_docs(self, router: Router) -> Dict[str, PathItem]:
         """Obtains a documentation object from the routes defined in a router."""
         paths_doc: Dict[str, PathItem] = {}
-        raw_dict = self.router_to_paths_dict(router, lambda route: route)
+        raw_dict = self.router_to_paths_dict(router)
 
         for path, conf in raw_dict.items():
-            path_item = PathItem()
+            operations: Dict[str, Operation] = {}
 
             for method, route in conf.items():
                 handler = self._get_request_handler(route)
@@ -894,8 +1101,9 @@ class OpenAPIHandler(APIDocsHandler[OpenAPI]):
                 )
                 if docs and docs.on_created:
                     docs.on_created(self, operation)
-                setattr(path_item, method, operation)
+                if method in _PATH_ITEM_OPERATIONS:
+                    operations[method] = operation
 
-            paths_doc[path] = path_item
+            paths_doc[path] = PathItem(**operations)
 
         return paths_doc
@@ -24,11 +24,7 @@ class TestClient:
     ) -> Response:
         """Simulates HTTP GET method"""
         return await self._test_simulator.send_request(
-            method="GET",
-            path=path,
-            headers=headers,
-            query=query,
-            content=None,
+            "GET", path, headers, query, None
         )
 
     async def post(
@@ -40,11 +36,7 @@ class TestClient:
     ) -> Response:
         """Simulates HTTP POST method"""
         return await self._test_simulator.send_request(
-            method="POST",
-            path=path,
-            headers=headers,
-            query=query,
-            content=content,
+            "POST", path, headers, query, content
         )
 
     async def patch(
@@ -56,11 +48,7 @@ class TestClient:
     ) -> Response:
         """Simulates HTTP PATCH method"""
         return await self._test_simulator.send_request(
-            method="PATCH",
-            path=path,
-            headers=headers,
-            query=query,
-            content=content,
+            "PATCH", path, headers, query, content
         )
 
     async def put(
@@ -72,11 +60,7 @@ class TestClient:
     ) -> Response:
         """Simulates HTTP PUT method"""
         return await self._test_simulator.send_request(
-            method="PUT",
-            path=path,
-            headers=headers,
-            query=query,
-            content=content,
+            "PUT", path, headers, query, content
         )
 
     async def delete(
@@ -88,11 +72,7 @@ class TestClient:
     ) -> Response:
         """Simulates HTTP DELETE method"""
         return await self._test_simulator.send_request(
-            method="DELETE",
-            path=path,
-            headers=headers,
-            query=query,
-            content=content,
+            "DELETE", path, headers, query, content
         )
 
     async def options(
@@ -103,11 +83,7 @@ class TestClient:
     ) -> Response:
         """Simulates HTTP OPTIONS method"""
         return await self._test_simulator.send_request(
-            method="OPTIONS",
-            path=path,
-            headers=headers,
-            query=query,
-            content=None,
+            "OPTIONS", path, headers, query, None
         )
 
     async def head(
@@ -118,11 +94,7 @@ class TestClient:
     ) -> Response:
         """Simulates HTTP HEAD method"""
         return await self._test_simulator.send_request(
-            method="HEAD",
-            path=path,
-            headers=headers,
-            query=query,
-            content=None,
+            "HEAD", path, headers, query, None
         )
 
     async def trace(
@@ -133,9 +105,5 @@ class TestClient:
     ) -> Response:
         """Simulates HTTP TRACE method"""
         return await self._test_simulator.send_request(
-            method="TRACE",
-            path=path,
-            headers=headers,
-            query=query,
-            content=None,
+            "TRACE", path, headers, query, None
         )
@@ -46,6 +46,9 @@ class AbstractTestSimulator:
             - put
             - delete
         Then you can define an own TestClient, with the custom logic.
+
+        TestClient passes all arguments positionally, in the order:
+        method, path, headers, query, content.
         """
 
 
@@ -1,3 +1,6 @@
+import os
+import sys
+
 from setuptools import setup, Extension
 
 
@@ -6,7 +9,26 @@ def readme():
         return f.read()
 
 
-COMPILE_ARGS = ["-O2"]
+if sys.platform == "win32":
+    COMPILE_ARGS = ["/O2", "/GL"]
+    LINK_ARGS = ["/LTCG"]
+else:
+    COMPILE_ARGS = ["-O3", "-flto"]
+    LINK_ARGS = ["-flto"]
+
+    # opt-in profile-guided optimization, see the compile-pgo target in Makefile:
+    # extensions built with "generate" write profiles when they are used, and
+    # extensions built again with "use" are optimized with those profiles
+    PGO = os.environ.get("BLACKSHEEP_PGO")
+
+    if PGO == "generate":
+        COMPILE_ARGS += ["-fprofile-generate"]
+        LINK_ARGS += ["-fprofile-generate"]
+    elif PGO == "use":
+        COMPILE_ARGS += ["-fprofile-use", "-fprofile-correction"]
+        LINK_ARGS += ["-fprofile-use"]
+    elif PGO:
+        raise ValueError("BLACKSHEEP_PGO must be either 'generate' or 'use'")
 
 
 setup(
@@ -48,42 +70,52 @@ setup(
     ],
     ext_modules=[
         Extension(
-            "blacksheep.url", ["blacksheep/url.c"], extra_compile_args=COMPILE_ARGS
+            "blacksheep.url",
+            ["blacksheep/url.c"],
+            extra_compile_args=COMPILE_ARGS,
+            extra_link_args=LINK_ARGS,
         ),
         Extension(
             "blacksheep.exceptions",
             ["blacksheep/exceptions.c"],
             extra_compile_args=COMPILE_ARGS,
+            extra_link_args=LINK_ARGS,
         ),
         Extension(
             "blacksheep.headers",
             ["blacksheep/headers.c"],
             extra_compile_args=COMPILE_ARGS,
+            extra_link_args=LINK_ARGS,
         ),
         Extension(
             "blacksheep.cookies",
             ["blacksheep/cookies.c"],
             extra_compile_args=COMPILE_ARGS,
+            extra_link_args=LINK_ARGS,
         ),
         Extension(
             "blacksheep.contents",
             ["blacksheep/contents.c"],
             extra_compile_args=COMPILE_ARGS,
+            extra_link_args=LINK_ARGS,
         ),
         Extension(
             "blacksheep.messages",
             ["blacksheep/messages.c"],
             extra_compile_args=COMPILE_ARGS,
+            extra_link_args=LINK_ARGS,
         ),
         Extension(
             "blacksheep.scribe",
             ["blacksheep/scribe.c"],
             extra_compile_args=COMPILE_ARGS,
+            extra_link_args=LINK_ARGS,
         ),
         Extension(
             "blacksheep.baseapp",
             ["blacksheep/baseapp.c"],
             extra_compile_args=COMPILE_ARGS,
+            extra_link_args=LINK_ARGS,
         ),
     ],
     install_requires=[
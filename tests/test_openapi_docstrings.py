@@ -10,6 +10,7 @@ from blacksheep.server.openapi.docstrings import (
     NumpydocDialect,
     ReStructuredTextDialect,
     collapse,
+    get_handler_docstring_info,
 )
 
 
@@ -780,3 +781,36 @@ def test_googledoc_dialect(docstring, expected_info):
 
     info = dialect.parse_docstring(docstring)
     assert expected_info == info
+
+
+def test_get_handler_docstring_info_parses_docstrings_once():
+    def handler():
+        """Example summary."""
+
+    info = get_handler_docstring_info(handler)
+
+    assert info is not None
+    assert info.summary == "Example summary."
+    assert get_handler_docstring_info(handler) is info
+
+
+def test_get_handler_docstring_info_handles_objects_without_weakref():
+    class Handler:
+        """Example summary."""
+
+        __slots__ = ()
+
+        def __call__(self):
+            ...
+
+    info = get_handler_docstring_info(Handler())
+
+    assert info is not None
+    assert info.summary == "Example summary."
+
+
+def test_get_handler_docstring_info_returns_none_for_missing_docstring():
+    def handler():
+        ...
+
+    assert get_handler_docstring_info(handler) is None
@@ -1,3 +1,4 @@
+import typing
 from dataclasses import dataclass
 from datetime import date, datetime
 from enum import IntEnum
@@ -5,16 +6,35 @@ from typing import Generic, List, Optional, Sequence, TypeVar, Union
 
 import pytest
 from openapidocs.common import Format, Serializer
-from openapidocs.v3 import Info, Reference, Schema, ValueFormat, ValueType
+from openapidocs.v3 import (
+    Info,
+    Operation,
+    ParameterLocation,
+    Reference,
+    Schema,
+    ValueFormat,
+    ValueType,
+)
 from pydantic import BaseModel, HttpUrl, validator
 from pydantic.generics import GenericModel
 from pydantic.types import NegativeFloat, PositiveInt, condecimal, confloat, conint
 
 from blacksheep.server.application import Application
+from blacksheep.server.bindings import (
+    CookieBinder,
+    FromHeader,
+    HeaderBinder,
+    JSONBinder,
+    QueryBinder,
+    RequestBinder,
+    RouteBinder,
+)
+from blacksheep.server.openapi import v3
 from blacksheep.server.openapi.common import (
     ContentInfo,
     EndpointDocs,
     OpenAPIEndpointException,
+    ParameterSource,
     ResponseInfo,
 )
 from blacksheep.server.openapi.exceptions import (
@@ -23,9 +43,12 @@ from blacksheep.server.openapi.exceptions import (
 )
 from blacksheep.server.openapi.v3 import (
     DataClassTypeHandler,
+    FieldInfo,
+    ObjectTypeHandler,
     OpenAPIHandler,
     PydanticModelTypeHandler,
     check_union,
+    is_ignored_parameter,
 )
 from blacksheep.server.routing import RoutesRegistry
 
@@ -276,6 +299,33 @@ def test_check_union(annotation, expected_result):
     assert check_union(annotation) == tuple(expected_result)
 
 
+class FromCustomHeader(FromHeader[T]):
+    pass
+
+
+class CustomHeaderBinder(HeaderBinder):
+    handle = FromCustomHeader
+
+
+@pytest.mark.parametrize(
+    "param_name,matching_binder,expected_result",
+    [
+        ("request", None, True),
+        ("services", None, True),
+        ("page", None, False),
+        ("page", QueryBinder(int, "page"), False),
+        ("cat_id", RouteBinder(int, "cat_id"), False),
+        ("input", JSONBinder(CreateCatInput, "input"), True),
+        ("request", RequestBinder(), True),
+        ("page", RequestBinder(), True),
+        ("x_foo", HeaderBinder(str, "x_foo"), False),
+        ("x_foo", CustomHeaderBinder(str, "x_foo"), False),
+    ],
+)
+def test_is_ignored_parameter(param_name, matching_binder, expected_result):
+    assert is_ignored_parameter(param_name, matching_binder) is expected_result
+
+
 def test_register_schema_can_handle_classes_with_same_name(docs):
     @dataclass
     class FooX:
@@ -299,6 +349,20 @@ def test_register_schema_can_handle_classes_with_same_name(docs):
     assert "a" in foo_schema.properties
 
 
+def test_register_schema_handles_many_classes_with_same_name(docs):
+    for _ in range(3):
+
+        @dataclass
+        class FooX:
+            x: str
+
+        FooX.__name__ = "Foo"
+        docs.register_schema_for_type(FooX)
+
+    assert list(docs.components.schemas.keys()) == ["Foo", "Foo1", "Foo2"]
+    assert docs._names_counters == {"Foo": 2}
+
+
 def test_register_schema_handles_repeated_calls(docs):
     docs.register_schema_for_type(Foo)
     docs.register_schema_for_type(Foo)
@@ -314,6 +378,42 @@ def test_register_schema_handles_repeated_calls(docs):
     assert "a" in foo_schema.properties
 
 
+def test_get_schema_by_type_caches_references(docs):
+    reference = docs.get_schema_by_type(Foo)
+    schema = docs.get_schema_by_type(List[Foo])
+
+    assert isinstance(reference, Reference)
+    assert docs.get_schema_by_type(Foo) is reference
+    assert isinstance(schema, Schema)
+    assert schema.items is reference
+
+    # schemas are not shared, since callers can modify them
+    assert docs.get_schema_by_type(List[Foo]) is not schema
+    assert docs.get_schema_by_type(List[Foo]) == schema
+    assert list(docs.components.schemas.keys()) == ["Foo"]
+
+
+def test_get_schema_by_type_reuses_references(docs):
+    reference = docs.register_schema_for_type(Foo)
+
+    assert isinstance(reference, Reference)
+    assert docs.register_schema_for_type(Foo) is reference
+    assert docs.get_schema_by_type(Foo) is reference
+    assert docs.get_schema_by_type(List[Foo]).items is reference
+
+
+def test_get_stored_reference_by_type_identity(docs):
+    object_type = PaginatedSet[Foo]
+    reference = docs.register_schema_for_type(object_type)
+
+    assert docs._objects_references_by_id[id(object_type)] == (
+        object_type,
+        reference,
+    )
+    assert docs._get_stored_reference(object_type) is reference
+    assert docs._get_stored_reference(PaginatedSet[Foo]) is reference
+
+
 def test_handles_forward_refs(docs):
     @dataclass
     class Friend:
@@ -331,6 +431,28 @@ def test_handles_forward_refs(docs):
     assert friend_schema.properties["foo"] == Reference(ref="#/components/schemas/Foo")
 
 
+def test_handles_forward_refs_obtaining_type_hints_once(docs, monkeypatch):
+    calls = []
+
+    def get_type_hints(object_type):
+        calls.append(object_type)
+        return typing.get_type_hints(object_type)
+
+    monkeypatch.setattr(v3, "get_type_hints", get_type_hints)
+
+    @dataclass
+    class Friends:
+        foo: "Foo"
+        ufo: "Ufo"
+
+    docs.register_schema_for_type(Friends)
+
+    assert calls == [Friends]
+    friends_schema = docs.components.schemas["Friends"]
+    assert friends_schema.properties["foo"] == Reference("#/components/schemas/Foo")
+    assert friends_schema.properties["ufo"] == Reference("#/components/schemas/Ufo")
+
+
 def test_register_schema_for_enum(docs):
     docs.register_schema_for_type(FooLevel)
 
@@ -345,6 +467,25 @@ def test_register_schema_for_enum(docs):
     assert schema.enum == [x.value for x in FooLevel]
 
 
+@pytest.mark.parametrize(
+    "object_type,expected_schema",
+    [
+        [str, Schema(type=ValueType.STRING)],
+        [int, Schema(type=ValueType.INTEGER, format=ValueFormat.INT64)],
+        [datetime, Schema(type=ValueType.STRING, format=ValueFormat.DATETIME)],
+        [Foo, None],
+    ],
+)
+def test_try_get_schema_for_simple_type(docs, object_type, expected_schema):
+    schema = docs._try_get_schema_for_simple_type(object_type)
+    assert schema == expected_schema
+
+    if schema is not None:
+        # returned schemas must not be shared
+        schema.nullable = False
+        assert docs._try_get_schema_for_simple_type(object_type) == expected_schema
+
+
 def test_try_get_schema_for_enum_returns_none_for_not_enum(docs):
     assert docs._try_get_schema_for_enum(Foo) is None
 
@@ -354,6 +495,75 @@ def test_get_parameters_returns_non_for_object_without_binders(docs):
     assert docs.get_request_body(Foo) is None
 
 
+def test_get_request_body_does_not_hide_errors_indexing_binders(docs):
+    def handler():
+        ...
+
+    handler.binders = [object()]
+
+    with pytest.raises(AttributeError):
+        docs.get_request_body(handler)
+
+
+@pytest.mark.parametrize(
+    "binder,expected_location",
+    [
+        [RouteBinder(int, "id"), ParameterLocation.PATH],
+        [QueryBinder(int, "page"), ParameterLocation.QUERY],
+        [CookieBinder(str, "session"), ParameterLocation.COOKIE],
+        [HeaderBinder(str, "x-foo"), ParameterLocation.HEADER],
+        [RequestBinder(), None],
+    ],
+)
+def test_get_parameter_location_for_binder(docs, binder, expected_location):
+    assert docs.get_parameter_location_for_binder(binder) is expected_location
+
+
+@pytest.mark.parametrize(
+    "source,expected_location",
+    [
+        [ParameterSource.QUERY, ParameterLocation.QUERY],
+        [ParameterSource.HEADER, ParameterLocation.HEADER],
+        [ParameterSource.PATH, ParameterLocation.PATH],
+        [ParameterSource.COOKIE, ParameterLocation.COOKIE],
+    ],
+)
+def test_parameter_source_to_openapi_obj(docs, source, expected_location):
+    assert docs._parameter_source_to_openapi_obj(source) is expected_location
+
+
+def test_get_binders_by_handler(docs):
+    def handler():
+        ...
+
+    body_binder = JSONBinder(CreateCatInput, "input")
+    query_binder = QueryBinder(int, "page")
+    handler.binders = [query_binder, body_binder]
+
+    assert docs._get_body_binder(handler) is body_binder
+    assert docs._get_binder_by_name(handler, "page") is query_binder
+    assert docs._get_binder_by_name(handler, "input") is body_binder
+    assert docs._get_binder_by_name(handler, "nope") is None
+    assert handler in docs._binders_index
+
+
+def test_get_binders_by_handler_reflects_new_binders(docs):
+    def handler():
+        ...
+
+    handler.binders = [JSONBinder(CreateCatInput, "input")]
+    assert docs._get_binder_by_name(handler, "page") is None
+
+    # binders are assigned again when a request handler is normalized
+    body_binder = JSONBinder(Cat, "input")
+    query_binder = QueryBinder(int, "page")
+    handler.binders = [query_binder, body_binder]
+
+    assert docs._get_body_binder(handler) is body_binder
+    assert docs._get_binder_by_name(handler, "page") is query_binder
+    assert docs._get_binder_by_name(handler, "input") is body_binder
+
+
 def test_get_content_from_response_info_returns_none_for_missing_content(docs):
     assert docs._get_content_from_response_info(None) is None
 
@@ -368,6 +578,44 @@ def test_open_api_handler_get_fields(docs: OpenAPIHandler):
     assert docs.get_fields(None) == []
 
 
+def test_open_api_handler_resolves_object_type_handlers(docs: OpenAPIHandler):
+    dataclass_handler, pydantic_handler = docs.object_types_handlers
+
+    assert docs._resolve_handler(Cat) is dataclass_handler
+    assert docs._resolve_handler(PydCat) is pydantic_handler
+    assert docs._resolve_handler(int) is None
+    assert docs._handler_for_type == {
+        Cat: dataclass_handler,
+        PydCat: pydantic_handler,
+        int: None,
+    }
+
+
+def test_open_api_handler_uses_object_type_handlers_added_later(
+    docs: OpenAPIHandler,
+):
+    class Custom:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    class CustomTypeHandler(ObjectTypeHandler):
+        def handles_type(self, object_type) -> bool:
+            return object_type is Custom
+
+        def get_type_fields(self, object_type) -> List[FieldInfo]:
+            return [FieldInfo("name", str)]
+
+    assert isinstance(docs.get_schema_by_type(Custom), Schema)
+    assert docs.get_fields(Custom) == []
+
+    handler = CustomTypeHandler()
+    docs.object_types_handlers.append(handler)
+
+    assert docs.get_fields(Custom) == [FieldInfo("name", str)]
+    assert docs.get_schema_by_type(Custom) == Reference("#/components/schemas/Custom")
+    assert docs._handler_for_type[Custom] is handler
+
+
 @pytest.mark.parametrize(
     "json_path,yaml_path,preferred_format,expected_result",
     [
@@ -494,6 +742,23 @@ components:
     )
 
 
+def test_get_fields_plan_is_reused_by_generic_types(docs: OpenAPIHandler):
+    docs.register_schema_for_type(PaginatedSet[Foo])
+    docs.register_schema_for_type(PaginatedSet[Ufo])
+
+    assert docs._get_fields_plan(PaginatedSet) == (
+        (("items", List[T]), ("total", int)),
+        ("items", "total"),
+    )
+    assert docs._get_fields_plan(Foo) == (
+        (("a", str), ("b", bool), ("level", FooLevel)),
+        ("a", "b"),
+    )
+    assert PaginatedSet in docs._fields_plans
+    assert "PaginatedSetOfFoo" in docs.components.schemas
+    assert "PaginatedSetOfUfo" in docs.components.schemas
+
+
 def test_register_schema_for_multiple_generic_with_list(
     docs: OpenAPIHandler, serializer: Serializer
 ):
@@ -1822,6 +2087,22 @@ def test_pydantic_model_handler_handles_type_without__fields__():
     handler.get_type_fields(Foo)
 
 
+@pytest.mark.parametrize(
+    "handler,object_type",
+    [
+        [DataClassTypeHandler(), Cat],
+        [PydanticModelTypeHandler(), PydCat],
+    ],
+)
+def test_object_type_handlers_cache_type_fields(handler, object_type):
+    type_fields = handler.get_type_fields(object_type)
+
+    assert [field.name for field in type_fields] == ["id", "name"]
+    assert handler.get_type_fields(object_type) is type_fields
+    assert isinstance(type_fields, tuple)
+    assert not hasattr(type_fields[0], "__dict__")
+
+
 @pytest.mark.asyncio
 async def test_schema_registration(docs: OpenAPIHandler, serializer: Serializer):
     @docs.register(
@@ -2004,3 +2285,106 @@ components:
                     nullable: false
 """.strip()
     )
+
+
+@pytest.mark.asyncio
+async def test_get_routes_docs_reflects_changes_to_documentation(
+    docs: OpenAPIHandler,
+):
+    app = get_app()
+
+    @app.route("/cats")
+    def get_cats() -> PaginatedSet[Cat]:
+        ...
+
+    docs.bind_app(app)
+    await app.start()
+
+    paths = docs.get_routes_docs(app.router)
+    assert "500" not in paths["/cats"].get.responses
+
+    docs.common_responses[500] = v3.ResponseDoc("Internal server error")
+
+    @app.router.get("/cats/{cat_id}")
+    def get_cat(cat_id: int) -> Cat:
+        ...
+
+    new_paths = docs.get_routes_docs(app.router)
+    assert "500" in new_paths["/cats"].get.responses
+    assert "/cats/{cat_id}" in new_paths
+
+    docs.common_responses[404] = v3.ResponseDoc("Not found")
+
+    assert "404" in docs.get_routes_docs(app.router)["/cats"].get.responses
+
+
+@pytest.mark.asyncio
+async def test_get_routes_docs_sets_operations_by_method(docs: OpenAPIHandler):
+    app = get_app()
+
+    @app.router.get("/cats")
+    def get_cats() -> PaginatedSet[Cat]:
+        ...
+
+    @app.router.post("/cats")
+    def create_cat(cat: Cat) -> None:
+        ...
+
+    @app.router.connect("/cats")
+    def connect_cats() -> None:
+        ...
+
+    docs.bind_app(app)
+    await app.start()
+
+    path_item = docs.get_routes_docs(app.router)["/cats"]
+
+    assert path_item.get is not None
+    assert path_item.get.operation_id == "get_cats"
+    assert path_item.post is not None
+    assert path_item.post.operation_id == "create_cat"
+    assert path_item.put is None
+    assert not hasattr(path_item, "connect")
+
+
+def test_router_to_paths_dict_keeps_routes_without_mapper(docs: OpenAPIHandler):
+    app = get_app()
+
+    @app.router.get("/cats/{cat_id}")
+    def get_cat(cat_id: int) -> Cat:
+        ...
+
+    route = app.router.routes[b"GET"][0]
+
+    assert docs.router_to_paths_dict(app.router) == {"/cats/{cat_id}": {"get": route}}
+    assert docs.router_to_paths_dict(app.router, lambda route: route.pattern) == {
+        "/cats/{cat_id}": {"get": route.pattern}
+    }
+
+
+@pytest.mark.asyncio
+async def test_schemas_of_types_shared_by_handlers_are_not_shared(
+    docs: OpenAPIHandler,
+):
+    app = get_app()
+
+    def set_minimum(docs: OpenAPIHandler, operation: Operation) -> None:
+        operation.parameters[0].schema.minimum = 1
+
+    @docs(on_created=set_minimum)
+    @app.router.get("/a")
+    def get_a(page: int) -> None:
+        ...
+
+    @app.router.get("/b")
+    def get_b(count: int) -> None:
+        ...
+
+    docs.bind_app(app)
+    await app.start()
+
+    paths = docs.get_routes_docs(app.router)
+
+    assert paths["/a"].get.parameters[0].schema.minimum == 1
+    assert paths["/b"].get.parameters[0].schema.minimum is None
+    assert docs.get_schema_by_type(int) is not docs.get_schema_by_type(int)
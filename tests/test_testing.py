@@ -133,6 +133,26 @@ async def test_custom_test_simulator(test_app):
     assert actual_response == expected_response
 
 
+@pytest.mark.asyncio
+async def test_client_passes_arguments_positionally(test_app):
+    calls = []
+
+    class PositionalTestSimulator(AbstractTestSimulator):
+        async def send_request(self, a, b, c, d, e):
+            calls.append((a, b, c, d, e))
+
+    test_client = TestClient(test_app, test_simulator=PositionalTestSimulator())
+    content = JSONContent({"foo": "bar"})
+
+    await test_client.get("/", {"foo": "bar"}, {"a": "b"})
+    await test_client.post("/a", None, None, content)
+
+    assert calls == [
+        ("GET", "/", {"foo": "bar"}, {"a": "b"}, None),
+        ("POST", "/a", None, None, content),
+    ]
+
+
 @pytest.mark.parametrize(
     "method, expected_method",
     [